@@ -1,17 +1,20 @@
 """This module is responsible for connecting all parts of the app."""
 
+import functools
 import os
 
 from contextlib import asynccontextmanager
 from typing import Union
 
 from fastapi import Depends, FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import bindparam, delete
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from sqlmodel import Session, select
 
 from .database import create_db_and_tables, engine
-from .data_processing import extract_banks_data, extract_countries_data
+from .data_processing import extract_all_data
 from .models import (
     Bank,
     BankCreate,
@@ -19,17 +22,99 @@ from .models import (
     BankBranch,
     Country,
     CountryWithBanks,
+    SWIFT_CODE_PREFIX_LEN,
+    bank_swift_code_prefix,
 )
 from .utils import (
     create_banks,
     create_countries,
-    check_code_length,
-    check_if_alpha,
-    check_if_alphanumeric,
     check_if_exists_in_db,
-    check_if_proper_headquarter_or_branch,
-    check_if_upper,
     get_session,
+    get_valid_bank_create,
+    get_valid_country_iso2_code,
+    get_valid_swift_code,
+    response_cache,
+)
+
+# in development and tests any relationship access emitting SQL that is not loaded
+# up front by the read endpoints raises an error (see README)
+RAISE_ON_LAZY_LOAD = os.getenv("RAISE_ON_LAZY_LOAD") == "1"
+
+
+def get_read_options(raise_on_lazy_load: bool):
+    """Gets loader options of the read endpoints.
+
+    Relationships used by the read endpoints are loaded up front
+    (branches are needed only for headquarters).
+
+    Parameters
+    ----------
+    raise_on_lazy_load : bool
+        Whether any other relationship access emitting SQL should raise an error.
+
+    Returns
+    -------
+    tuple[list, list, list]
+        Loader options for reading a branch, a headquarter and a country.
+    """
+    branch_options = [joinedload(Bank.country)]
+    headquarter_options = [joinedload(Bank.country), selectinload(Bank.branches)]
+    country_options = [selectinload(Country.banks)]
+
+    if raise_on_lazy_load:
+        branch_options += [raiseload("*", sql_only=True)]
+        headquarter_options += [
+            selectinload(Bank.branches).raiseload("*", sql_only=True),
+            raiseload("*", sql_only=True),
+        ]
+        country_options += [
+            selectinload(Country.banks).raiseload("*", sql_only=True),
+            raiseload("*", sql_only=True),
+        ]
+
+    return branch_options, headquarter_options, country_options
+
+
+@functools.lru_cache(maxsize=2)
+def get_read_statements(raise_on_lazy_load: bool):
+    """Gets statements of the read endpoints (built once for each value of the flag).
+
+    Parameters
+    ----------
+    raise_on_lazy_load : bool
+        Whether any relationship access emitting SQL that is not loaded up front
+        should raise an error (see get_read_options).
+
+    Returns
+    -------
+    tuple[Select, Select, Select]
+        Statements reading a branch, a headquarter and a country.
+    """
+    branch_options, headquarter_options, country_options = get_read_options(
+        raise_on_lazy_load
+    )
+    return (
+        select(Bank)
+        .where(Bank.swift_code == bindparam("swift_code"))
+        .options(*branch_options),
+        select(Bank)
+        .where(Bank.swift_code == bindparam("swift_code"))
+        .options(*headquarter_options),
+        select(Country)
+        .where(Country.iso2 == bindparam("iso2"))
+        .options(*country_options),
+    )
+
+
+# statements used in every request are built once, only the parameters differ
+# (building them per request costs more than executing them)
+BANK_STATEMENT = select(Bank).where(Bank.swift_code == bindparam("swift_code"))
+COUNTRY_STATEMENT = select(Country).where(Country.iso2 == bindparam("iso2"))
+BRANCHES_STATEMENT = select(Bank).where(bank_swift_code_prefix == bindparam("prefix"))
+DELETE_BANK_STATEMENT = (
+    delete(Bank)
+    .where(Bank.swift_code == bindparam("swift_code"))
+    .returning(Bank.swift_code)
 )
 
 
@@ -44,11 +129,10 @@ async def lifespan(app: FastAPI):
     """
     excel_file_path = "./data/swift_codes.xlsx"
     database_file_path = "./data/database.db"
-    banks_data = extract_banks_data(excel_file_path)
-    countries_data = extract_countries_data(excel_file_path)
-    if not os.path.exists(database_file_path):
+    if not os.path.exists(database_file_path):  # the Excel file is read only when needed
+        banks_data, countries_data = extract_all_data(excel_file_path)
         create_db_and_tables()
-        with Session(engine) as session:
+        with Session(engine) as session, session.begin():  # a single commit
             create_countries(session=session, countries_data=countries_data)
             create_banks(session=session, banks_data=banks_data)
     yield
@@ -60,9 +144,14 @@ app = FastAPI(lifespan=lifespan)
 @app.get(
     "/v1/swift-codes/{swift_code}",
     status_code=status.HTTP_200_OK,
-    response_model=Union[BankHeadquarter, BankBranch],
+    response_model=None,  # returned JSON is already serialized from the model
+    responses={status.HTTP_200_OK: {"model": Union[BankHeadquarter, BankBranch]}},
 )
-def read_bank(*, session: Session = Depends(get_session), swift_code: str):
+def read_bank(
+    *,
+    session: Session = Depends(get_session),
+    swift_code: str = Depends(get_valid_swift_code),
+):
     """Gets information about the bank with the specified SWIFT code.
 
     Parameters
@@ -74,30 +163,50 @@ def read_bank(*, session: Session = Depends(get_session), swift_code: str):
 
     Returns
     -------
-    BankHeadquarter or BankBranch or JSONResponse\n
-        Bank information with branches if headquarter, otherwise without branches.\n
+    Response or JSONResponse\n
+        BankHeadquarter (bank information with branches) if headquarter,\n
+        otherwise BankBranch (without branches), serialized to JSON.\n
         JSONResponse contains details of HTTPException raised during execution:\n
             - Not found (404) if a bank with a given SWIFT code does not exist in the database.\n
             - Unprocessable entity (422) if the SWIFT code is incorrect.\n
     """
-    check_if_alphanumeric(code=swift_code)
-    check_code_length(code=swift_code, code_type="SWIFT")
-    check_if_upper(text=swift_code, text_type="SWIFT code")
-    bank = session.exec(select(Bank).where(Bank.swift_code == swift_code)).first()
-    check_if_exists_in_db(bank)
-
-    if bank.is_headquarter:
-        return BankHeadquarter.from_bank(bank)
-    else:
-        return BankBranch.from_bank(bank)
+    cache_key = ("bank", swift_code)
+    content = response_cache.get(cache_key)
+
+    if content is None:
+        cache_version = response_cache.version
+        branch_statement, headquarter_statement, _ = get_read_statements(
+            RAISE_ON_LAZY_LOAD
+        )
+        # only headquarters end with XXX (ensured when banks are created)
+        is_headquarter = swift_code.endswith("XXX")
+        bank = session.exec(
+            headquarter_statement if is_headquarter else branch_statement,
+            params={"swift_code": swift_code},
+        ).first()
+        check_if_exists_in_db(bank)
+
+        if is_headquarter:
+            response = BankHeadquarter.from_bank(bank)
+        else:
+            response = BankBranch.from_bank(bank)
+        content = response.model_dump_json().encode()
+        response_cache.set(cache_key, content, cache_version)
+
+    return Response(content=content, media_type="application/json")
 
 
 @app.get(
     "/v1/swift-codes/country/{country_iso2_code}",
     status_code=status.HTTP_200_OK,
-    response_model=CountryWithBanks,
+    response_model=None,  # returned JSON is already serialized from the model
+    responses={status.HTTP_200_OK: {"model": CountryWithBanks}},
 )
-def read_country(*, session: Session = Depends(get_session), country_iso2_code: str):
+def read_country(
+    *,
+    session: Session = Depends(get_session),
+    country_iso2_code: str = Depends(get_valid_country_iso2_code),
+):
     """Gets information about the country with the specified ISO2 code.
 
     Parameters
@@ -109,25 +218,36 @@ def read_country(*, session: Session = Depends(get_session), country_iso2_code:
 
     Returns
     -------
-    CountryWithBanks or JSONResponse\n
-        Country information with associated banks.\n
+    Response or JSONResponse\n
+        CountryWithBanks (country information with associated banks) serialized to JSON.\n
         JSONResponse contains details of HTTPException raised during execution:\n
             - Not found (404) if a country with a given ISO2 code does not exist in the database.\n
             - Unprocessable entity (422) if the country ISO2 code is incorrect.\n
     """
-    check_if_alpha(code=country_iso2_code)
-    check_code_length(code=country_iso2_code, code_type="ISO2")
-    check_if_upper(text=country_iso2_code, text_type="ISO2 code")
-    country = session.exec(
-        select(Country).where(Country.iso2 == country_iso2_code)
-    ).first()
-    check_if_exists_in_db(country)
+    cache_key = ("country", country_iso2_code)
+    content = response_cache.get(cache_key)
+
+    if content is None:
+        cache_version = response_cache.version
+        *_, country_statement = get_read_statements(RAISE_ON_LAZY_LOAD)
+        country = session.exec(
+            country_statement, params={"iso2": country_iso2_code}
+        ).first()
+        check_if_exists_in_db(country)
 
-    return CountryWithBanks.from_country(country)
+        response = CountryWithBanks.from_country(country)
+        content = response.model_dump_json().encode()
+        response_cache.set(cache_key, content, cache_version)
+
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/v1/swift-codes", status_code=status.HTTP_201_CREATED)
-def create_bank(*, session: Session = Depends(get_session), bank_create: BankCreate):
+def create_bank(
+    *,
+    session: Session = Depends(get_session),
+    bank_create: BankCreate = Depends(get_valid_bank_create),
+):
     """Inserts a bank and a country (if needed) to the database.
 
     Parameters
@@ -153,32 +273,12 @@ def create_bank(*, session: Session = Depends(get_session), bank_create: BankCre
         Conflict (409) if SWIFT code uniqueness is violated.\n
         Internal server error (500) if database error.\n
     """
-    # code length checks are managed by SQLModel (no additional check needed)
-    check_if_alpha(code=bank_create.countryISO2)
-    check_if_alphanumeric(code=bank_create.swiftCode)
-    check_if_upper(text=bank_create.swiftCode, text_type="SWIFT code")
-    check_if_upper(text=bank_create.countryISO2, text_type="ISO2 code")
-    check_if_upper(text=bank_create.countryName, text_type="country name")
-    check_if_proper_headquarter_or_branch(
-        swift_code=bank_create.swiftCode, is_headquarter=bank_create.isHeadquarter
-    )
-
     country = session.exec(
-        select(Country).where(Country.iso2 == bank_create.countryISO2)
+        COUNTRY_STATEMENT, params={"iso2": bank_create.countryISO2}
     ).first()
 
-    if not country:  # new countries are created when needed
+    if not country:  # new countries are created when needed (together with the bank)
         country = Country(iso2=bank_create.countryISO2, name=bank_create.countryName)
-        try:
-            session.add(country)
-            session.commit()
-            session.refresh(country)
-        except OperationalError as e:
-            session.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database error.",
-            ) from e
 
     else:  # country already existed in the database
         if country.name != bank_create.countryName:
@@ -200,17 +300,16 @@ def create_bank(*, session: Session = Depends(get_session), bank_create: BankCre
 
     if bank_create.isHeadquarter:
         bank.branches = session.exec(
-            select(Bank).where(
-                Bank.swift_code.like(
-                    bank_create.swiftCode[:8] + "___"
-                )  # like() from SQLAlchemy is used (causes linting error)
-                # This is a workaround for a lack of LIKE support in the current version of SQLModel
-            )
+            BRANCHES_STATEMENT,
+            params={"prefix": bank_create.swiftCode[:SWIFT_CODE_PREFIX_LEN]},
         ).all()
 
     else:
         bank.headquarter = session.exec(
-            select(Bank).where(Bank.swift_code == bank_create.swiftCode[:8] + "XXX")
+            BANK_STATEMENT,
+            params={
+                "swift_code": bank_create.swiftCode[:SWIFT_CODE_PREFIX_LEN] + "XXX"
+            },
         ).first()
 
     try:
@@ -229,6 +328,7 @@ def create_bank(*, session: Session = Depends(get_session), bank_create: BankCre
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error."
         ) from e
 
+    response_cache.clear()  # branches and banks of countries could have changed
     return JSONResponse(
         content={
             "message": f"SWIFT CODE = {bank_create.swiftCode} successfully created."
@@ -237,7 +337,11 @@ def create_bank(*, session: Session = Depends(get_session), bank_create: BankCre
 
 
 @app.delete("/v1/swift-codes/{swift_code}", status_code=status.HTTP_200_OK)
-def delete_bank(*, session: Session = Depends(get_session), swift_code: str):
+def delete_bank(
+    *,
+    session: Session = Depends(get_session),
+    swift_code: str = Depends(get_valid_swift_code),
+):
     """Deletes the bank with the given SWIFT code from the database
 
     Parameters
@@ -261,14 +365,11 @@ def delete_bank(*, session: Session = Depends(get_session), swift_code: str):
         Conflict (409) if database integrity is violated.\n
         Internal server error (500) if database error.\n
     """
-    check_if_alphanumeric(code=swift_code)
-    check_code_length(code=swift_code, code_type="SWIFT")
-    check_if_upper(text=swift_code, text_type="SWIFT code")
-    bank = session.exec(select(Bank).where(Bank.swift_code == swift_code)).first()
-    check_if_exists_in_db(bank)
-    deleted_swift_code = bank.swift_code
-    try:
-        session.delete(bank)
+    try:  # a single DELETE ... RETURNING instead of loading the bank first
+        deleted_swift_code = session.exec(
+            DELETE_BANK_STATEMENT, params={"swift_code": swift_code}
+        ).scalar()
+        check_if_exists_in_db(deleted_swift_code)
         session.commit()
     except IntegrityError as e:
         session.rollback()
@@ -281,6 +382,7 @@ def delete_bank(*, session: Session = Depends(get_session), swift_code: str):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error."
         ) from e
+    response_cache.clear()  # branches and banks of countries could have changed
     return JSONResponse(
         content={"message": f"SWIFT CODE = {deleted_swift_code} successfully deleted."}
     )
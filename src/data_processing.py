@@ -1,17 +1,79 @@
 """This module is responsible for extracting required information from the Excel Spreadsheet."""
 
-import numpy as np
-import pandas as pd
+from python_calamine import CalamineWorkbook
 
+from .models import SWIFT_CODE_PATTERN, SWIFT_CODE_PREFIX_LEN
 
-def extract_banks_data(file_path: str):
-    """Extracts banks data from the Excel file.
+EXCEL_COLUMNS_RENAMING_DICT = {
+    "SWIFT CODE": "swift_code",
+    "NAME": "name",
+    "ADDRESS": "address",
+    "COUNTRY ISO2 CODE": "country_iso2",
+    "COUNTRY NAME": "country_name",
+}
+
+
+def parse_excel_data(excel_file):
+    """Reads all columns required by the app from the first sheet of the Excel file.
+
+    Rows are read directly with calamine (Rust), without building a DataFrame.
+
+    Parameters
+    ----------
+    excel_file : file-like object
+        The Excel file opened in binary mode.
+
+    Returns
+    -------
+    list[dict]
+        One dictionary per row, keyed by values of EXCEL_COLUMNS_RENAMING_DICT.
+        All values are strings (empty cells are empty strings).
+    """
+    header, *rows = (
+        CalamineWorkbook.from_filelike(excel_file).get_sheet_by_index(0).to_python()
+    )
+
+    columns = [
+        (header.index(column), key)
+        for column, key in EXCEL_COLUMNS_RENAMING_DICT.items()
+    ]
+    return [{key: str(row[index]) for index, key in columns} for row in rows]
+
+
+def read_excel_data(file_path: str):
+    """Reads all columns required by the app from the Excel file.
 
     Parameters
     ----------
     file_path : str
         The path of the Excel file.
 
+    Returns
+    -------
+    list[dict]
+        Data returned by parse_excel_data.
+
+    Raises
+    ------
+    FileNotFoundError
+        When incorrect file path.
+    """
+    if isinstance(file_path, str):
+        with open(file_path, "rb") as excel_file:
+            return parse_excel_data(excel_file)
+
+    file_path.seek(0)  # the file-like object may have just been written to
+    return parse_excel_data(file_path)
+
+
+def banks_data_from_rows(rows: list[dict]):
+    """Converts data read from the Excel file to banks data.
+
+    Parameters
+    ----------
+    rows : list[dict]
+        Data returned by read_excel_data.
+
     Returns
     -------
     list[dict]
@@ -25,43 +87,92 @@ def extract_banks_data(file_path: str):
                 "is_headquarter": bool,
                 "potential_hq": str
             }
+        Headquarters come first, then branches, each in the order of the file.
+    """
+    headquarters, branches, incorrect_swift_codes = [], [], []
+
+    for row in rows:
+        swift_code = row["swift_code"]
+        if not SWIFT_CODE_PATTERN.fullmatch(swift_code):
+            incorrect_swift_codes.append(swift_code)
+            continue
+
+        is_headquarter = swift_code.endswith("XXX")
+        # headquarters need to be inserted first for the referential integrity
+        (headquarters if is_headquarter else branches).append(
+            {
+                "country_iso2": row["country_iso2"],
+                "swift_code": swift_code,
+                "name": row["name"],
+                "address": row["address"],
+                "is_headquarter": is_headquarter,
+                # branches without a headquarter exist (e.g., ALBPPLP1BMW)
+                # checks are performed during DB insertion
+                "potential_hq": swift_code[:SWIFT_CODE_PREFIX_LEN] + "XXX",
+            }
+        )
+
+    if incorrect_swift_codes:
+        print("Incorrect SWIFT codes were skipped:")
+        print(", ".join(incorrect_swift_codes))
+
+    return headquarters + branches
+
+
+def countries_data_from_rows(rows: list[dict]):
+    """Converts data read from the Excel file to countries data.
+
+    Parameters
+    ----------
+    rows : list[dict]
+        Data returned by read_excel_data.
+
+    Returns
+    -------
+    list[dict]
+        Dictionaries of values to be used during countries' table model creation.
+        Structure of the dictionaries:
+            {
+                "iso2": str,
+                "name": str
+            }
+        Countries are sorted by their ISO2 codes.
+    """
+    # there can be many banks from the same country; the first occurrence is kept
+    countries = {}
+    for row in rows:
+        countries.setdefault(row["country_iso2"], row["country_name"])
+
+    return [{"iso2": iso2, "name": countries[iso2]} for iso2 in sorted(countries)]
+
+
+def extract_banks_data(file_path: str):
+    """Extracts banks data from the Excel file.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the Excel file.
+
+    Returns
+    -------
+    list[dict]
+        Dictionaries of values to be used during banks' table model creation
+        (see banks_data_from_rows).
 
     Raises
     ------
     FileNotFoundError
         When incorrect file path.
     """
-    columns_to_use = ["SWIFT CODE", "NAME", "ADDRESS", "COUNTRY ISO2 CODE"]
-    columns_renaming_dict = {
-        "SWIFT CODE": "swift_code",
-        "NAME": "name",
-        "ADDRESS": "address",
-        "COUNTRY ISO2 CODE": "country_iso2",
-    }
-
     try:
-        df = (
-            pd.read_excel(file_path, usecols=columns_to_use)
-            .rename(columns=columns_renaming_dict)
-            .replace({np.nan: ""})  # otherwise empty strings are nan
-        )
+        rows = read_excel_data(file_path)
     except FileNotFoundError:
         print("Path to the file containg banks data is incorrect.")
         print("No banks data extracted.")
-        return [{}]
-
-    df["is_headquarter"] = df["swift_code"].str.endswith("XXX")
-    df["potential_hq"] = df["swift_code"].str[:8] + str(
-        "XXX"
-    )  # these are potential headquarters
-    # branches without a headquarter exist (e.g., ALBPPLP1BMW)
-    # checks are performed during DB insertion
-
-    return df.sort_values(  # headquarters need to be inserted first for the referential integrity
-        by=["is_headquarter", "swift_code"], ascending=[False, True]
-    ).to_dict(
-        "records"
-    )
+        return []
+
+    return banks_data_from_rows(rows)
 
 
 def extract_countries_data(file_path: str):
@@ -75,33 +186,47 @@ def extract_countries_data(file_path: str):
     Returns
     -------
     list[dict]
-        Dictionaries of values to be used during countries' table model creation.
-        Structure of the dictionaries:
-            {
-                "iso2": str,
-                "name": str
-            }
+        Dictionaries of values to be used during countries' table model creation
+        (see countries_data_from_rows).
 
     Raises
     ------
     FileNotFoundError
         When incorrect file path.
     """
-    columns_to_use = ["COUNTRY ISO2 CODE", "COUNTRY NAME"]
-    columns_renaming_dict = {
-        "COUNTRY ISO2 CODE": "iso2",
-        "COUNTRY NAME": "name",
-    }
-
     try:
-        return (
-            pd.read_excel(file_path, usecols=columns_to_use)
-            .drop_duplicates()  # there can be many banks from the same country
-            .rename(columns=columns_renaming_dict)
-            .sort_values(by="iso2")
-            .to_dict("records")
-        )
+        rows = read_excel_data(file_path)
     except FileNotFoundError:
         print("Path to the file containg countries data is incorrect.")
         print("No countries data extracted.")
-        return {}
+        return []
+
+    return countries_data_from_rows(rows)
+
+
+def extract_all_data(file_path: str):
+    """Extracts banks and countries data from the Excel file, reading it only once.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the Excel file.
+
+    Returns
+    -------
+    tuple[list[dict], list[dict]]
+        Banks data (see banks_data_from_rows) and countries data (see countries_data_from_rows).
+
+    Raises
+    ------
+    FileNotFoundError
+        When incorrect file path.
+    """
+    try:
+        rows = read_excel_data(file_path)
+    except FileNotFoundError:
+        print("Path to the file containg banks and countries data is incorrect.")
+        print("No data extracted.")
+        return [], []
+
+    return banks_data_from_rows(rows), countries_data_from_rows(rows)
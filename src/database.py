@@ -1,15 +1,40 @@
 """This module is responsible for creating database and tables."""
 
-from sqlmodel import SQLModel, create_engine, text
+from sqlalchemy import event
+from sqlmodel import SQLModel, create_engine
 
 SQLITE_FILE_NAME = "./data/database.db"
 SQLITE_URL = f"sqlite:///{SQLITE_FILE_NAME}"
+SQLITE_PRAGMAS = {
+    "foreign_keys": "ON",  # SQLite enforces foreign keys only when enabled per connection
+    "journal_mode": "WAL",  # readers do not block the writer (and vice versa)
+    "synchronous": "NORMAL",  # safe in WAL mode, syncs only at checkpoints
+    "cache_size": -64 * 1024,  # in KiB when negative (64 MiB)
+    "temp_store": "MEMORY",
+    "mmap_size": 256 * 1024 * 1024,  # pages are read via mmap instead of read calls
+}
 
+# file databases use a QueuePool of persistent connections (check_same_thread=False)
 engine = create_engine(SQLITE_URL)
 
 
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Sets SQLITE_PRAGMAS on every new connection to the database.
+
+    Parameters
+    ----------
+    dbapi_connection : sqlite3.Connection
+        New DBAPI connection.
+    connection_record : sqlalchemy.pool.ConnectionPoolEntry
+        Pool entry of the connection (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
 def create_db_and_tables():
     """Creates database and tables."""
     SQLModel.metadata.create_all(engine)
-    with engine.connect() as connection:
-        connection.execute(text("PRAGMA foreign_keys=ON"))
@@ -1,9 +1,19 @@
 """This module is responsible for creating Country and Bank models."""
 
+import re
+
+from pydantic import ConfigDict
+from sqlalchemy import Index, func, literal_column
 from sqlmodel import Field, Relationship, SQLModel
 
 ISO2_CODE_LEN = 2
 SWIFT_CODE_LEN = 11
+# uppercase alphanumeric with at least one letter, shared by the Excel import and the API
+# so that every imported bank can also be read and deleted
+SWIFT_CODE_PATTERN = re.compile(f"(?=.*[A-Z])[0-9A-Z]{{{SWIFT_CODE_LEN}}}")
+# response models are only built from database rows and never modified afterwards
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+SWIFT_CODE_PREFIX_LEN = 8  # the part shared by a headquarter and its branches
 
 
 class Bank(SQLModel, table=True):
@@ -27,14 +37,27 @@ class Bank(SQLModel, table=True):
         back_populates="branches",
         passive_deletes="all",
     )
+    # related banks are returned by the API sorted by SWIFT code (not by insertion order)
     branches: list["Bank"] = Relationship(
-        back_populates="headquarter", passive_deletes="all"
+        sa_relationship_kwargs=dict(order_by="Bank.swift_code"),
+        back_populates="headquarter",
+        passive_deletes="all",
     )
 
 
+# Literal arguments are needed for SQLite to match queries against the expression index
+# (LIKE is case-insensitive in SQLite, so it cannot use the index on swift_code).
+bank_swift_code_prefix = func.substr(
+    Bank.swift_code, literal_column("1"), literal_column(str(SWIFT_CODE_PREFIX_LEN))
+)
+Index("ix_bank_swift_code_prefix", bank_swift_code_prefix)
+
+
 class BankWithoutCountryName(SQLModel):
     """Object model for the bank used in a list of headquarter's branches or country's banks."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     address: str
     bankName: str
     countryISO2: str = Field(min_length=ISO2_CODE_LEN, max_length=ISO2_CODE_LEN)
@@ -77,13 +100,15 @@ class BankCreate(SQLModel):
     swiftCode: str = Field(min_length=SWIFT_CODE_LEN, max_length=SWIFT_CODE_LEN)
 
     @classmethod
-    def from_bank(cls, bank: Bank):
+    def from_bank(cls, bank: Bank, **kwargs):
         """Creates object of BankCreate based on the Bank object.
 
         Parameters
         ----------
         bank : Bank
             Bank object to be converted.
+        **kwargs
+            Values of additional fields defined by subclasses.
 
         Returns
         -------
@@ -97,16 +122,21 @@ class BankCreate(SQLModel):
             countryName=bank.country.name,
             isHeadquarter=bank.is_headquarter,
             swiftCode=bank.swift_code,
+            **kwargs,
         )
 
 
 class BankBranch(BankCreate):
     """Object model for the bank used when describing a branch directly."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
 
 class BankHeadquarter(BankCreate):
     """Object model for the bank used when describing a headquarter."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     branches: list[BankWithoutCountryName]
 
     @classmethod
@@ -123,9 +153,8 @@ class BankHeadquarter(BankCreate):
         BankHeadquarter
             New object of the BankHeadquarter class.
         """
-        base = BankCreate.from_bank(bank)
         branches = [BankWithoutCountryName.from_bank(b) for b in bank.branches]
-        return cls(**base.model_dump(), branches=branches)
+        return super().from_bank(bank, branches=branches)
 
 
 class Country(SQLModel, table=True):
@@ -134,12 +163,20 @@ class Country(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     iso2: str = Field(min_length=ISO2_CODE_LEN, max_length=ISO2_CODE_LEN, index=True, unique=True)
     name: str
-    banks: list["Bank"] = Relationship(back_populates="country")
+    # headquarters first, then branches, each sorted by SWIFT code
+    banks: list["Bank"] = Relationship(
+        sa_relationship_kwargs=dict(
+            order_by="[Bank.is_headquarter.desc(), Bank.swift_code]"
+        ),
+        back_populates="country",
+    )
 
 
 class CountryWithBanks(SQLModel):
     """Object model for the country used when describing country with associated banks."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     countryISO2: str = Field(min_length=ISO2_CODE_LEN, max_length=ISO2_CODE_LEN)
     countryName: str
     swiftCodes: list[BankWithoutCountryName]
@@ -1,19 +1,75 @@
 """This module gathers helper functions."""
 
+import re
+import threading
+
 from typing import Literal
 
 from fastapi import HTTPException, status
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from .database import engine
 
 from .models import (
     Bank,
+    BankCreate,
     Country,
     SWIFT_CODE_LEN,
+    SWIFT_CODE_PATTERN,
     ISO2_CODE_LEN,
 )
 
+CODE_LENGTHS = {"SWIFT": SWIFT_CODE_LEN, "ISO2": ISO2_CODE_LEN}
+# correct codes are accepted by a single compiled regex match, incorrect ones
+# are checked one by one to report what exactly is wrong with them
+CORRECT_ISO2_CODE_PATTERN = re.compile(f"[A-Z]{{{ISO2_CODE_LEN}}}")
+
+
+class ResponseCache:
+    """In-process cache of JSON responses returned by the read endpoints.
+
+    Banks and countries change only through the API, so responses are kept
+    until the next successful creation or deletion, which clears the whole cache.
+    Only existing items are cached, so its size is limited by the database.
+    Handlers run concurrently in the threadpool, so set and clear hold a lock
+    (a response read before a clear must not be stored after it).
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.version = 0  # incremented on every clear
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]):
+        """Gets cached response content (None if there is no response for the key)."""
+        return self.responses.get(key)
+
+    def set(self, key: tuple[str, str], response: bytes, version: int):
+        """Caches response unless the cache was cleared since the version was read.
+
+        Parameters
+        ----------
+        key : tuple[str, str]
+            Endpoint name and the code provided in the request.
+        response : bytes
+            Content of the response to be cached (serialized response model).
+        version : int
+            Version of the cache read before querying the database.
+        """
+        with self.lock:
+            if version == self.version:
+                self.responses[key] = response
+
+    def clear(self):
+        """Removes all cached responses."""
+        with self.lock:
+            self.version += 1
+            self.responses = {}
+
+
+response_cache = ResponseCache()
+
 
 def get_session():
     """Gets new session."""
@@ -22,7 +78,7 @@ def get_session():
 
 
 def create_banks(*, session: Session, banks_data: list[dict]):
-    """Adds banks data to database.
+    """Adds banks data to database (changes are committed by the caller).
 
     Parameters
     ----------
@@ -40,30 +96,46 @@ def create_banks(*, session: Session, banks_data: list[dict]):
                 "potential_hq": str
             }
     """
-    for bank in banks_data:
-        country = session.exec(
-            select(Country).where(Country.iso2 == bank["country_iso2"])
-        ).first()
-        headquarter = session.exec(
-            select(Bank).where(Bank.swift_code == bank["potential_hq"])
-        ).first()
-
-        session.add(
-            Bank(
-                swift_code=bank["swift_code"],
-                name=bank["name"],
-                address=bank["address"],
-                is_headquarter=bank["is_headquarter"],
-                country=country,
-                headquarter=headquarter,
-            )
+    country_ids = dict(session.exec(select(Country.iso2, Country.id)).all())
+    headquarter_ids = dict(
+        session.exec(select(Bank.swift_code, Bank.id).where(Bank.is_headquarter)).all()
+    )
+
+    def to_mapping(bank: dict):
+        return {
+            "swift_code": bank["swift_code"],
+            "name": bank["name"],
+            "address": bank["address"],
+            "is_headquarter": bank["is_headquarter"],
+            "country_id": country_ids.get(bank["country_iso2"]),
+            "headquarter_id": (
+                None
+                if bank["is_headquarter"]
+                else headquarter_ids.get(bank["potential_hq"])
+            ),
+        }
+
+    # headquarters are inserted first, so that branches can refer to them
+    headquarters_mappings = [
+        to_mapping(bank) for bank in banks_data if bank["is_headquarter"]
+    ]
+    if headquarters_mappings:  # RETURNING gives ids of new headquarters in bulk
+        headquarter_ids.update(
+            session.exec(
+                insert(Bank).returning(Bank.swift_code, Bank.id),
+                params=headquarters_mappings,
+            ).all()
         )
 
-        session.commit()
+    branches_mappings = [
+        to_mapping(bank) for bank in banks_data if not bank["is_headquarter"]
+    ]
+    if branches_mappings:  # executemany of a single prepared INSERT
+        session.exec(insert(Bank), params=branches_mappings)
 
 
 def create_countries(*, session: Session, countries_data: list[dict]):
-    """Adds countries data to database.
+    """Adds countries data to database (changes are committed by the caller).
 
     Parameters
     ----------
@@ -77,12 +149,14 @@ def create_countries(*, session: Session, countries_data: list[dict]):
                 "name": str
             }
     """
-    for country in countries_data:
-        session.add(Country(iso2=country["iso2"], name=country["name"]))
-    session.commit()
+    countries_mappings = [
+        {"iso2": country["iso2"], "name": country["name"]} for country in countries_data
+    ]
+    if countries_mappings:  # executemany of a single prepared INSERT
+        session.exec(insert(Country), params=countries_mappings)
 
 
-def check_code_length(code: str, code_type=Literal["SWIFT", "ISO2"]):
+def check_code_length(code: str, code_type: Literal["SWIFT", "ISO2"]):
     """Checks if the provided code has correct lenght (11 for SWIFT, 2 for country ISO2).
 
     Parameters
@@ -97,14 +171,9 @@ def check_code_length(code: str, code_type=Literal["SWIFT", "ISO2"]):
     HTTPException
         Unprocessable entity (422) if the code length is incorrect.
     """
-    length = SWIFT_CODE_LEN if code_type == "SWIFT" else ISO2_CODE_LEN
-    length_condition = (
-        len(code) != SWIFT_CODE_LEN
-        if code_type == "SWIFT"
-        else len(code) != ISO2_CODE_LEN
-    )
+    length = CODE_LENGTHS[code_type]
 
-    if length_condition:
+    if len(code) != length:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"{code_type} code should consist of {length} characters.",
@@ -152,7 +221,7 @@ def check_if_alphanumeric(code: str):
 
 
 def check_if_upper(
-    text: str, text_type=Literal["SWIFT code", "ISO2 code", "country name"]
+    text: str, text_type: Literal["SWIFT code", "ISO2 code", "country name"]
 ):
     """Checks if the provided text is uppercase.
 
@@ -175,13 +244,13 @@ def check_if_upper(
         )
 
 
-def check_if_exists_in_db(obj: Bank | Country):
+def check_if_exists_in_db(obj: Bank | Country | str | None):
     """Checks if the given object exists.
 
     Parameters
     ----------
-    obj : Bank | Country
-        Bank or Country object to be checked.
+    obj : Bank | Country | str | None
+        Bank or Country object (or a value returned for it by the database) to be checked.
 
     Raises
     ------
@@ -213,12 +282,95 @@ def check_if_proper_headquarter_or_branch(swift_code: str, is_headquarter: bool)
     HTTPException
         Unprocessable entity (422) if information in SWIFT code and about being headquarter differ.
     """
-    last_three_symbols_in_swift = swift_code[-3:]
-
-    if (last_three_symbols_in_swift == "XXX" and not is_headquarter) or (
-        last_three_symbols_in_swift != "XXX" and is_headquarter
-    ):
+    if swift_code.endswith("XXX") != is_headquarter:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Headquarter's SWIFT codes must end with XXX and branches' cannot and with XXX.",
         )
+
+
+def get_valid_swift_code(swift_code: str):
+    """Validates the SWIFT code path parameter before the endpoint is called.
+
+    Parameters
+    ----------
+    swift_code : str
+        The SWIFT code of the bank.
+
+    Returns
+    -------
+    str
+        The SWIFT code of the bank.
+
+    Raises
+    ------
+    HTTPException
+        Unprocessable entity (422) if the SWIFT code is incorrect.
+    """
+    if not SWIFT_CODE_PATTERN.fullmatch(swift_code):
+        check_if_alphanumeric(code=swift_code)
+        check_code_length(code=swift_code, code_type="SWIFT")
+        check_if_upper(text=swift_code, text_type="SWIFT code")
+    return swift_code
+
+
+def get_valid_country_iso2_code(country_iso2_code: str):
+    """Validates the country ISO2 code path parameter before the endpoint is called.
+
+    Parameters
+    ----------
+    country_iso2_code : str
+        The ISO2 code of the country.
+
+    Returns
+    -------
+    str
+        The ISO2 code of the country.
+
+    Raises
+    ------
+    HTTPException
+        Unprocessable entity (422) if the country ISO2 code is incorrect.
+    """
+    if not CORRECT_ISO2_CODE_PATTERN.fullmatch(country_iso2_code):
+        check_if_alpha(code=country_iso2_code)
+        check_code_length(code=country_iso2_code, code_type="ISO2")
+        check_if_upper(text=country_iso2_code, text_type="ISO2 code")
+    return country_iso2_code
+
+
+def get_valid_bank_create(bank_create: BankCreate):
+    """Validates the body of the request creating a bank before the endpoint is called.
+
+    Code length checks are managed by SQLModel (no additional check needed).
+
+    Parameters
+    ----------
+    bank_create : BankCreate
+        JSON providing information about the bank and the country.
+
+    Returns
+    -------
+    BankCreate
+        JSON providing information about the bank and the country.
+
+    Raises
+    ------
+    HTTPException
+        Unprocessable entity (422) if the bank SWIFT code is incorrect.
+        Unprocessable entity (422) if the country ISO2 code is incorrect.
+        Unprocessable entity (422) if the country name is not uppercase.
+    """
+    if not (
+        CORRECT_ISO2_CODE_PATTERN.fullmatch(bank_create.countryISO2)
+        and SWIFT_CODE_PATTERN.fullmatch(bank_create.swiftCode)
+    ):
+        check_if_alpha(code=bank_create.countryISO2)
+        check_if_alphanumeric(code=bank_create.swiftCode)
+        check_if_upper(text=bank_create.swiftCode, text_type="SWIFT code")
+        check_if_upper(text=bank_create.countryISO2, text_type="ISO2 code")
+    check_if_upper(text=bank_create.countryName, text_type="country name")
+    check_if_proper_headquarter_or_branch(
+        swift_code=bank_create.swiftCode, is_headquarter=bank_create.isHeadquarter
+    )
+    return bank_create
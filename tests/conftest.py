@@ -1,14 +1,351 @@
 """This module includes fixtures which are used by more than one test module."""
 
+import pickle
+
+from io import BytesIO
+
 import pytest
 import pandas as pd
 
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from src.app import app
-from src.utils import get_session
+from src.utils import get_session, response_cache
+
+# data is built once; fixtures return deep copies, so tests can modify them safely
+BANKS_DATA = [
+    {
+        "swift_code": "A1234567XXX",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": True,
+        "country_iso2": "PL",
+        "headquarter": None,
+    },
+    {
+        "swift_code": "D1234567XXX",
+        "name": "Deutsche Bank",
+        "address": "Deutsche Bank Address",
+        "is_headquarter": True,
+        "country_iso2": "DE",
+        "headquarter": None,
+    },
+    {
+        "swift_code": "P1234567XXX",
+        "name": "PKO Bank",
+        "address": "PKO Bank Address",
+        "is_headquarter": True,
+        "country_iso2": "PL",
+        "headquarter": None,
+    },
+    {
+        "swift_code": "A0987654321",
+        "name": "Alior Bank",
+        "address": " ",
+        "is_headquarter": False,
+        "country_iso2": "PL",
+        "headquarter": None,
+    },
+    {
+        "swift_code": "A1234567890",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": False,
+        "country_iso2": "PL",
+        "headquarter": "A1234567XXX",
+    },
+    {
+        "swift_code": "A1234567891",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": False,
+        "country_iso2": "PL",
+        "headquarter": "A1234567XXX",
+    },
+    {
+        "swift_code": "C1234567890",
+        "name": "Commerzbank",
+        "address": "",
+        "is_headquarter": False,
+        "country_iso2": "DE",
+        "headquarter": "C1234567XXX",
+    },
+    {
+        "swift_code": "D1234567890",
+        "name": "Deutsche Bank",
+        "address": "Deutsche Bank Address",
+        "is_headquarter": False,
+        "country_iso2": "DE",
+        "headquarter": "D1234567XXX",
+    },
+]
+
+BANKS_DATA_AFTER_EXCEL = [
+    {
+        "country_iso2": "PL",
+        "swift_code": "A1234567XXX",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": True,
+        "potential_hq": "A1234567XXX",
+    },
+    {
+        "country_iso2": "DE",
+        "swift_code": "D1234567XXX",
+        "name": "Deutsche Bank",
+        "address": "Deutsche Bank Address",
+        "is_headquarter": True,
+        "potential_hq": "D1234567XXX",
+    },
+    {
+        "country_iso2": "PL",
+        "swift_code": "P1234567XXX",
+        "name": "PKO Bank",
+        "address": "PKO Bank Address",
+        "is_headquarter": True,
+        "potential_hq": "P1234567XXX",
+    },
+    {
+        "country_iso2": "PL",
+        "swift_code": "A1234567891",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": False,
+        "potential_hq": "A1234567XXX",
+    },
+    {
+        "country_iso2": "PL",
+        "swift_code": "A1234567890",
+        "name": "Alior Bank",
+        "address": "Alior Bank Address",
+        "is_headquarter": False,
+        "potential_hq": "A1234567XXX",
+    },
+    {
+        "country_iso2": "PL",
+        "swift_code": "A0987654321",
+        "name": "Alior Bank",
+        "address": " ",
+        "is_headquarter": False,
+        "potential_hq": "A0987654XXX",
+    },
+    {
+        "country_iso2": "DE",
+        "swift_code": "D1234567890",
+        "name": "Deutsche Bank",
+        "address": "Deutsche Bank Address",
+        "is_headquarter": False,
+        "potential_hq": "D1234567XXX",
+    },
+    {
+        "country_iso2": "DE",
+        "swift_code": "C1234567890",
+        "name": "Commerzbank",
+        "address": "",
+        "is_headquarter": False,
+        "potential_hq": "C1234567XXX",
+    },
+]
+
+COUNTRIES_DATA_AFTER_EXCEL = [
+    {"iso2": "DE", "name": "GERMANY"},
+    {"iso2": "PL", "name": "POLAND"},
+]
+
+EXPECTED_RESULTS_OF_READING_BANKS = {
+    "A1234567XXX": {
+        "address": "Alior Bank Address",
+        "bankName": "Alior Bank",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": True,
+        "swiftCode": "A1234567XXX",
+        "branches": {
+            "A1234567890": {
+                "address": "Alior Bank Address",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": False,
+                "swiftCode": "A1234567890",
+            },
+            "A1234567891": {
+                "address": "Alior Bank Address",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": False,
+                "swiftCode": "A1234567891",
+            },
+        },
+        "branches_len": 2,
+    },
+    "D1234567XXX": {
+        "address": "Deutsche Bank Address",
+        "bankName": "Deutsche Bank",
+        "countryISO2": "DE",
+        "countryName": "GERMANY",
+        "isHeadquarter": True,
+        "swiftCode": "D1234567XXX",
+        "branches": {
+            "D1234567890": {
+                "address": "Deutsche Bank Address",
+                "bankName": "Deutsche Bank",
+                "countryISO2": "DE",
+                "isHeadquarter": False,
+                "swiftCode": "D1234567890",
+            },
+        },
+        "branches_len": 1,
+    },
+    "P1234567XXX": {
+        "address": "PKO Bank Address",
+        "bankName": "PKO Bank",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": True,
+        "swiftCode": "P1234567XXX",
+        "branches": {},
+        "branches_len": 0,
+    },
+    "A0987654321": {
+        "address": " ",
+        "bankName": "Alior Bank",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": False,
+        "swiftCode": "A0987654321",
+        "branches": None,
+    },
+    "A1234567890": {
+        "address": "Alior Bank Address",
+        "bankName": "Alior Bank",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": False,
+        "swiftCode": "A1234567890",
+        "branches": None,
+    },
+    "A1234567891": {
+        "address": "Alior Bank Address",
+        "bankName": "Alior Bank",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": False,
+        "swiftCode": "A1234567891",
+        "branches": None,
+    },
+    "C1234567890": {
+        "address": "",
+        "bankName": "Commerzbank",
+        "countryISO2": "DE",
+        "countryName": "GERMANY",
+        "isHeadquarter": False,
+        "swiftCode": "C1234567890",
+        "branches": None,
+    },
+    "D1234567890": {
+        "address": "Deutsche Bank Address",
+        "bankName": "Deutsche Bank",
+        "countryISO2": "DE",
+        "countryName": "GERMANY",
+        "isHeadquarter": False,
+        "swiftCode": "D1234567890",
+        "branches": None,
+    },
+}
+
+EXPECTED_RESULTS_OF_READING_COUNTRIES = {
+    "PL": {
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "swiftCodes": {
+            "A1234567XXX": {
+                "address": "Alior Bank Address",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": True,
+                "swiftCode": "A1234567XXX",
+            },
+            "P1234567XXX": {
+                "address": "PKO Bank Address",
+                "bankName": "PKO Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": True,
+                "swiftCode": "P1234567XXX",
+            },
+            "A0987654321": {
+                "address": " ",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": False,
+                "swiftCode": "A0987654321",
+            },
+            "A1234567890": {
+                "address": "Alior Bank Address",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": False,
+                "swiftCode": "A1234567890",
+            },
+            "A1234567891": {
+                "address": "Alior Bank Address",
+                "bankName": "Alior Bank",
+                "countryISO2": "PL",
+                "isHeadquarter": False,
+                "swiftCode": "A1234567891",
+            },
+        },
+        "swift_codes_len": 5,
+    },
+    "DE": {
+        "countryISO2": "DE",
+        "countryName": "GERMANY",
+        "swiftCodes": {
+            "D1234567XXX": {
+                "address": "Deutsche Bank Address",
+                "bankName": "Deutsche Bank",
+                "countryISO2": "DE",
+                "isHeadquarter": True,
+                "swiftCode": "D1234567XXX",
+            },
+            "C1234567890": {
+                "address": "",
+                "bankName": "Commerzbank",
+                "countryISO2": "DE",
+                "isHeadquarter": False,
+                "swiftCode": "C1234567890",
+            },
+            "D1234567890": {
+                "address": "Deutsche Bank Address",
+                "bankName": "Deutsche Bank",
+                "countryISO2": "DE",
+                "isHeadquarter": False,
+                "swiftCode": "D1234567890",
+            },
+        },
+        "swift_codes_len": 3,
+    },
+}
+
+
+def copy_data(data):
+    """Creates deep copy of the fixture data.
+
+    A pickle round trip is several times faster than copy.deepcopy for such data.
+
+    Parameters
+    ----------
+    data : list | dict
+        Data to be copied.
+
+    Returns
+    -------
+    list | dict
+        Deep copy of the data.
+    """
+    return pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 @pytest.fixture(name="banks_data")
@@ -28,149 +365,21 @@ def fixture_banks_data():
     list[dict]
         List of dicts representing banks.
     """
-    return [
-        {
-            "swift_code": "A1234567XXX",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": True,
-            "country_iso2": "PL",
-            "headquarter": None,
-        },
-        {
-            "swift_code": "D1234567XXX",
-            "name": "Deutsche Bank",
-            "address": "Deutsche Bank Address",
-            "is_headquarter": True,
-            "country_iso2": "DE",
-            "headquarter": None,
-        },
-        {
-            "swift_code": "P1234567XXX",
-            "name": "PKO Bank",
-            "address": "PKO Bank Address",
-            "is_headquarter": True,
-            "country_iso2": "PL",
-            "headquarter": None,
-        },
-        {
-            "swift_code": "A0987654321",
-            "name": "Alior Bank",
-            "address": " ",
-            "is_headquarter": False,
-            "country_iso2": "PL",
-            "headquarter": None,
-        },
-        {
-            "swift_code": "A1234567890",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": False,
-            "country_iso2": "PL",
-            "headquarter": "A1234567XXX",
-        },
-        {
-            "swift_code": "A1234567891",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": False,
-            "country_iso2": "PL",
-            "headquarter": "A1234567XXX",
-        },
-        {
-            "swift_code": "C1234567890",
-            "name": "Commerzbank",
-            "address": "",
-            "is_headquarter": False,
-            "country_iso2": "DE",
-            "headquarter": "C1234567XXX",
-        },
-        {
-            "swift_code": "D1234567890",
-            "name": "Deutsche Bank",
-            "address": "Deutsche Bank Address",
-            "is_headquarter": False,
-            "country_iso2": "DE",
-            "headquarter": "D1234567XXX",
-        },
-    ]
+    return copy_data(BANKS_DATA)
 
 
 @pytest.fixture(name="banks_data_after_excel")
 def fixture_banks_data_after_excel():
     """Expected result of extracting banks data.
 
+    Headquarters come first, then branches, each in the order of mock_df.
+
     Returns
     -------
     list[dict]
         List of dicts representing banks.
     """
-    return [
-        {
-            "country_iso2": "PL",
-            "swift_code": "A1234567XXX",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": True,
-            "potential_hq": "A1234567XXX",
-        },
-        {
-            "country_iso2": "DE",
-            "swift_code": "D1234567XXX",
-            "name": "Deutsche Bank",
-            "address": "Deutsche Bank Address",
-            "is_headquarter": True,
-            "potential_hq": "D1234567XXX",
-        },
-        {
-            "country_iso2": "PL",
-            "swift_code": "P1234567XXX",
-            "name": "PKO Bank",
-            "address": "PKO Bank Address",
-            "is_headquarter": True,
-            "potential_hq": "P1234567XXX",
-        },
-        {
-            "country_iso2": "PL",
-            "swift_code": "A0987654321",
-            "name": "Alior Bank",
-            "address": " ",
-            "is_headquarter": False,
-            "potential_hq": "A0987654XXX",
-        },
-        {
-            "country_iso2": "PL",
-            "swift_code": "A1234567890",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": False,
-            "potential_hq": "A1234567XXX",
-        },
-        {
-            "country_iso2": "PL",
-            "swift_code": "A1234567891",
-            "name": "Alior Bank",
-            "address": "Alior Bank Address",
-            "is_headquarter": False,
-            "potential_hq": "A1234567XXX",
-        },
-        {
-            "country_iso2": "DE",
-            "swift_code": "C1234567890",
-            "name": "Commerzbank",
-            "address": "",
-            "is_headquarter": False,
-            "potential_hq": "C1234567XXX",
-        },
-        {
-            "country_iso2": "DE",
-            "swift_code": "D1234567890",
-            "name": "Deutsche Bank",
-            "address": "Deutsche Bank Address",
-            "is_headquarter": False,
-            "potential_hq": "D1234567XXX",
-        },
-    ]
+    return copy_data(BANKS_DATA_AFTER_EXCEL)
 
 
 @pytest.fixture(name="countries_data_after_excel")
@@ -182,12 +391,12 @@ def fixture_countries_data_after_excel():
     list[dict]
         List of dicts representing countries.
     """
-    return [{"iso2": "DE", "name": "GERMANY"}, {"iso2": "PL", "name": "POLAND"}]
+    return copy_data(COUNTRIES_DATA_AFTER_EXCEL)
 
 
-@pytest.fixture(name="mock_df")
-def fixture_mock_df():
-    """Exemplary data stored in Excel file.
+@pytest.fixture(name="mock_df_template", scope="session")
+def fixture_mock_df_template():
+    """Exemplary data stored in Excel file, built once for the whole test session.
 
     The data includes following cases:
     - headquarter with branches,
@@ -249,208 +458,119 @@ def fixture_mock_df():
     )
 
 
+@pytest.fixture(name="mock_df")
+def fixture_mock_df(mock_df_template: pd.DataFrame):
+    """Exemplary data stored in Excel file (see mock_df_template).
+
+    Returns
+    -------
+    pandas.DataFrame
+        Copy of the Pandas DataFrame containig exemplary data.
+    """
+    return mock_df_template.copy()
+
+
+@pytest.fixture(name="mock_excel_bytes", scope="session")
+def fixture_mock_excel_bytes(mock_df_template: pd.DataFrame):
+    """Exemplary Excel file, written once for the whole test session.
+
+    Returns
+    -------
+    bytes
+        Content of the Excel file containing mock_df data.
+    """
+    output = BytesIO()
+
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        mock_df_template.to_excel(writer, sheet_name="Sheet1", index=False)
+
+    return output.getvalue()
+
+
 @pytest.fixture(name="expected_results_of_reading_banks")
 def fixture_expected_results_of_reading_banks():
     """Expected results of reading exemplary banks data from the database."""
-    return {
-        "A1234567XXX": {
-            "address": "Alior Bank Address",
-            "bankName": "Alior Bank",
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "isHeadquarter": True,
-            "swiftCode": "A1234567XXX",
-            "branches": {
-                "A1234567890": {
-                    "address": "Alior Bank Address",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": False,
-                    "swiftCode": "A1234567890",
-                },
-                "A1234567891": {
-                    "address": "Alior Bank Address",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": False,
-                    "swiftCode": "A1234567891",
-                },
-            },
-            "branches_len": 2,
-        },
-        "D1234567XXX": {
-            "address": "Deutsche Bank Address",
-            "bankName": "Deutsche Bank",
-            "countryISO2": "DE",
-            "countryName": "GERMANY",
-            "isHeadquarter": True,
-            "swiftCode": "D1234567XXX",
-            "branches": {
-                "D1234567890": {
-                    "address": "Deutsche Bank Address",
-                    "bankName": "Deutsche Bank",
-                    "countryISO2": "DE",
-                    "isHeadquarter": False,
-                    "swiftCode": "D1234567890",
-                },
-            },
-            "branches_len": 1,
-        },
-        "P1234567XXX": {
-            "address": "PKO Bank Address",
-            "bankName": "PKO Bank",
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "isHeadquarter": True,
-            "swiftCode": "P1234567XXX",
-            "branches": {},
-            "branches_len": 0,
-        },
-        "A0987654321": {
-            "address": " ",
-            "bankName": "Alior Bank",
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "isHeadquarter": False,
-            "swiftCode": "A0987654321",
-            "branches": None,
-        },
-        "A1234567890": {
-            "address": "Alior Bank Address",
-            "bankName": "Alior Bank",
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "isHeadquarter": False,
-            "swiftCode": "A1234567890",
-            "branches": None,
-        },
-        "A1234567891": {
-            "address": "Alior Bank Address",
-            "bankName": "Alior Bank",
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "isHeadquarter": False,
-            "swiftCode": "A1234567891",
-            "branches": None,
-        },
-        "C1234567890": {
-            "address": "",
-            "bankName": "Commerzbank",
-            "countryISO2": "DE",
-            "countryName": "GERMANY",
-            "isHeadquarter": False,
-            "swiftCode": "C1234567890",
-            "branches": None,
-        },
-        "D1234567890": {
-            "address": "Deutsche Bank Address",
-            "bankName": "Deutsche Bank",
-            "countryISO2": "DE",
-            "countryName": "GERMANY",
-            "isHeadquarter": False,
-            "swiftCode": "D1234567890",
-            "branches": None,
-        },
-    }
+    return copy_data(EXPECTED_RESULTS_OF_READING_BANKS)
 
 
 @pytest.fixture(name="expected_results_of_reading_countries")
 def fixture_expected_results_of_reading_countries():
     """Expected results of reading exemplary countries data from the database."""
-    return {
-        "PL": {
-            "countryISO2": "PL",
-            "countryName": "POLAND",
-            "swiftCodes": {
-                "A1234567XXX": {
-                    "address": "Alior Bank Address",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": True,
-                    "swiftCode": "A1234567XXX",
-                },
-                "P1234567XXX": {
-                    "address": "PKO Bank Address",
-                    "bankName": "PKO Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": True,
-                    "swiftCode": "P1234567XXX",
-                },
-                "A0987654321": {
-                    "address": " ",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": False,
-                    "swiftCode": "A0987654321",
-                },
-                "A1234567890": {
-                    "address": "Alior Bank Address",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": False,
-                    "swiftCode": "A1234567890",
-                },
-                "A1234567891": {
-                    "address": "Alior Bank Address",
-                    "bankName": "Alior Bank",
-                    "countryISO2": "PL",
-                    "isHeadquarter": False,
-                    "swiftCode": "A1234567891",
-                },
-            },
-            "swift_codes_len": 5,
-        },
-        "DE": {
-            "countryISO2": "DE",
-            "countryName": "GERMANY",
-            "swiftCodes": {
-                "D1234567XXX": {
-                    "address": "Deutsche Bank Address",
-                    "bankName": "Deutsche Bank",
-                    "countryISO2": "DE",
-                    "isHeadquarter": True,
-                    "swiftCode": "D1234567XXX",
-                },
-                "C1234567890": {
-                    "address": "",
-                    "bankName": "Commerzbank",
-                    "countryISO2": "DE",
-                    "isHeadquarter": False,
-                    "swiftCode": "C1234567890",
-                },
-                "D1234567890": {
-                    "address": "Deutsche Bank Address",
-                    "bankName": "Deutsche Bank",
-                    "countryISO2": "DE",
-                    "isHeadquarter": False,
-                    "swiftCode": "D1234567890",
-                },
-            },
-            "swift_codes_len": 3,
-        },
-    }
+    return copy_data(EXPECTED_RESULTS_OF_READING_COUNTRIES)
 
 
-@pytest.fixture(name="session")
-def fixture_session():
-    """Creates new session for in-memory database.
+@pytest.fixture(name="engine", scope="session")
+def fixture_engine():
+    """Creates in-memory database with all tables once for the whole test session.
 
     Yields
     -------
-    sqlmodel.Session
-        SQLModel Session connected with in-memory database.
+    sqlalchemy.Engine
+        Engine connected with in-memory database.
     """
     engine = create_engine(
         "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
     )
+
+    # pysqlite does not emit BEGIN for SAVEPOINTs on its own,
+    # so transactions are started explicitly (as in the SQLAlchemy docs)
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def fixture_session(engine: Engine):
+    """Creates new session for in-memory database, rolled back after the test.
+
+    Commits made during the test (also by the app) only release SAVEPOINTs
+    of the outer transaction, so every test starts with empty tables.
+
+    Yields
+    -------
+    sqlmodel.Session
+        SQLModel Session connected with in-memory database.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        transaction.rollback()
+
+
+@pytest.fixture(name="test_client", scope="session")
+def fixture_test_client():
+    """Creates FastAPI client once for the whole test session.
+
+    The client is not used as a context manager, so the lifespan of the app
+    (creating the database from the Excel file) is not run.
+
+    Returns
+    -------
+    fastapi.TestClient
+        Test client of the app.
+    """
+    return TestClient(app)
 
 
 @pytest.fixture(name="client")
-def fixture_client(session: Session):
-    """Creates new FastAPI client for in-memory database.
+def fixture_client(
+    test_client: TestClient, session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    """Connects FastAPI client with in-memory database.
+
+    Relationships not loaded up front by the read endpoints raise an error
+    when accessed (see RAISE_ON_LAZY_LOAD in src/app.py).
 
     Yields
     -------
@@ -461,8 +581,9 @@ def fixture_client(session: Session):
     def get_session_override():
         return session
 
+    monkeypatch.setattr("src.app.RAISE_ON_LAZY_LOAD", True)
     app.dependency_overrides[get_session] = get_session_override
+    response_cache.clear()  # responses cached by other tests come from other databases
 
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+    yield test_client
+    app.dependency_overrides.pop(get_session, None)
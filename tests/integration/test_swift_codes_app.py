@@ -3,7 +3,6 @@
 from io import BytesIO
 
 import pytest
-import pandas as pd
 
 from fastapi import status
 
@@ -13,7 +12,7 @@ from src.data_processing import extract_banks_data, extract_countries_data
 from src.utils import create_banks, create_countries
 
 
-@pytest.fixture(name="expected_results_of_reading_banks_after_post")
+@pytest.fixture(name="expected_results_of_reading_banks_after_post", scope="module")
 def fixture_expected_results_of_reading_banks_after_post():
     """Expected results of reading banks data from the database after post."""
     return {
@@ -144,7 +143,9 @@ def fixture_expected_results_of_reading_banks_after_post():
     }
 
 
-@pytest.fixture(name="expected_results_of_reading_countries_after_post")
+@pytest.fixture(
+    name="expected_results_of_reading_countries_after_post", scope="module"
+)
 def fixture_expected_results_of_reading_countries_after_post():
     """Expected results of reading countries data from the database after post."""
     return {
@@ -235,8 +236,57 @@ def fixture_expected_results_of_reading_countries_after_post():
     }
 
 
+def check_reading_data(
+    client,
+    banks_data,
+    countries_data,
+    expected_results_of_reading_banks,
+    expected_results_of_reading_countries,
+):
+    """Checks if all banks and countries are read correctly.
+
+    Parameters
+    ----------
+    client : fastapi.TestClient
+        Test client used with in-memory database.
+    banks_data : list[dict]
+        List of dicts representing banks data.
+    countries_data : list[dict]
+        List of dicts representing countries data.
+    expected_results_of_reading_banks : dict{dict}
+        Dict of dicts presenting expected banks data.
+    expected_results_of_reading_countries : dict{dict}
+        Dict of dicts presenting expected countries data.
+    """
+    for bank in banks_data:
+        swift_code = bank["swift_code"]
+        expected_result = expected_results_of_reading_banks[swift_code]
+
+        response = client.get(f"/v1/swift-codes/{swift_code}")
+        data = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+
+        check_bank_data_correctness(
+            request_result=data, expected_result=expected_result
+        )
+
+    for country in countries_data:
+        iso2_code = country["iso2"]
+        expected_result = expected_results_of_reading_countries[iso2_code]
+
+        response = client.get(f"/v1/swift-codes/country/{iso2_code}")
+        data = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+
+        check_country_data_correctness(
+            request_result=data, expected_result=expected_result
+        )
+
+
 def test_swift_codes_app(
-    mock_df,
+    mock_excel_bytes,
     session,
     client,
     countries_data_after_excel,
@@ -247,8 +297,8 @@ def test_swift_codes_app(
 ):
     """Tests the whole flow of the application from loading.
 
-    mock_df : pandas.DataFrame
-        The data used in mock Excel file.
+    mock_excel_bytes : bytes
+        Content of the mock Excel file.
     session : sqlmodel.Session
         SQLModel Session used to interact with in-memory database.
     fastapi.TestClient
@@ -268,10 +318,7 @@ def test_swift_codes_app(
         Dict of dicts presenting expected countries data of retrieving
         banks data after DELETE operation.
     """
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        mock_df.to_excel(writer, sheet_name="Sheet1", index=False)
+    output = BytesIO(mock_excel_bytes)
 
     banks_data = extract_banks_data(output)
     countries_data = extract_countries_data(output)
@@ -308,31 +355,15 @@ def test_swift_codes_app(
     )
     assert response.status_code == status.HTTP_200_OK
 
-    for bank in banks_data:
-        swift_code = bank["swift_code"]
-        expected_result = expected_results_of_reading_banks_after_post[swift_code]
-
-        response = client.get(f"/v1/swift-codes/{swift_code}")
-        data = response.json()
-
-        assert response.status_code == status.HTTP_200_OK
-
-        check_bank_data_correctness(
-            request_result=data, expected_result=expected_result
-        )
-
-    for country in countries_data_after_excel:
-        iso2_code = country["iso2"]
-        expected_result = expected_results_of_reading_countries_after_post[iso2_code]
-
-        response = client.get(f"/v1/swift-codes/country/{iso2_code}")
-        data = response.json()
-
-        assert response.status_code == status.HTTP_200_OK
-
-        check_country_data_correctness(
-            request_result=data, expected_result=expected_result
-        )
+    check_reading_data(
+        client=client,
+        banks_data=banks_data,
+        countries_data=countries_data_after_excel,
+        expected_results_of_reading_banks=expected_results_of_reading_banks_after_post,
+        expected_results_of_reading_countries=(
+            expected_results_of_reading_countries_after_post
+        ),
+    )
 
     response = client.delete(f"/v1/swift-codes/{commerzbank_hq['swiftCode']}")
     assert response.status_code == status.HTTP_200_OK
@@ -340,31 +371,13 @@ def test_swift_codes_app(
     response = client.delete(f"/v1/swift-codes/{pko_bank_branch['swiftCode']}")
     assert response.status_code == status.HTTP_200_OK
 
-    for bank in banks_data:
-        swift_code = bank["swift_code"]
-        expected_result = expected_results_of_reading_banks[swift_code]
-
-        response = client.get(f"/v1/swift-codes/{swift_code}")
-        data = response.json()
-
-        assert response.status_code == status.HTTP_200_OK
-
-        check_bank_data_correctness(
-            request_result=data, expected_result=expected_result
-        )
-
-    for country in countries_data_after_excel:
-        iso2_code = country["iso2"]
-        expected_result = expected_results_of_reading_countries[iso2_code]
-
-        response = client.get(f"/v1/swift-codes/country/{iso2_code}")
-        data = response.json()
-
-        assert response.status_code == status.HTTP_200_OK
-
-        check_country_data_correctness(
-            request_result=data, expected_result=expected_result
-        )
+    check_reading_data(
+        client=client,
+        banks_data=banks_data,
+        countries_data=countries_data_after_excel,
+        expected_results_of_reading_banks=expected_results_of_reading_banks,
+        expected_results_of_reading_countries=expected_results_of_reading_countries,
+    )
 
     assert (
         client.get(f"/v1/swift-codes/{commerzbank_hq['swiftCode']}").json()["detail"]
@@ -215,6 +215,53 @@ def test_create_bank_correct_data(
         )
 
 
+def test_create_bank_cached_responses(
+    session: Session, client: TestClient, banks_data, countries_data_after_excel
+):
+    """Tests if responses cached by GET requests are not returned after POST request.
+
+    Parameters
+    ----------
+    session : sqlmodel.Session
+        SQLModel Session used to interact with in-memory database.
+    fastapi.TestClient
+        Test client used with in-memory database.
+    banks_data : list[dict]
+        List of dicts used for creating table models of banks.
+    countries_data_after_excel : list[dict]
+        List of dicts used for creating table models of countries.
+    """
+    insert_exemplary_data_into_db(session, banks_data, countries_data_after_excel)
+
+    headquarter_before = client.get("/v1/swift-codes/P1234567XXX").json()
+    country_before = client.get("/v1/swift-codes/country/PL").json()
+    assert (
+        client.get("/v1/swift-codes/P1234567XXX").json() == headquarter_before
+    ), "Cached response should be the same"
+
+    response = client.post(
+        "/v1/swift-codes",
+        json={
+            "address": "PKO Bank Address",
+            "bankName": "PKO Bank",
+            "countryISO2": "PL",
+            "countryName": "POLAND",
+            "isHeadquarter": False,
+            "swiftCode": "P1234567890",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    headquarter_after = client.get("/v1/swift-codes/P1234567XXX").json()
+    country_after = client.get("/v1/swift-codes/country/PL").json()
+    assert (
+        len(headquarter_after["branches"]) == len(headquarter_before["branches"]) + 1
+    ), "New branch should be returned"
+    assert (
+        len(country_after["swiftCodes"]) == len(country_before["swiftCodes"]) + 1
+    ), "New bank should be returned"
+
+
 def test_create_bank_incorrect_bank_data(client: TestClient):
     """Tests if correct responses are provided for incorrect data during bank creation.
 
@@ -403,6 +450,43 @@ def test_create_bank_unique_constraint_failed(client: TestClient):
     ), "Detail should be different"
 
 
+def test_create_bank_unique_constraint_failed_new_country(client: TestClient):
+    """Tests if a new country is not created when creation of its bank fails.
+
+    Parameters
+    ----------
+    fastapi.TestClient
+        Test client used with in-memory database.
+    """
+    request1 = {
+        "address": "valid address",
+        "bankName": "valid bank name",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": False,
+        "swiftCode": "SWIFTCODEEE",
+    }
+    request2 = {
+        "address": "valid address",
+        "bankName": "valid bank name",
+        "countryISO2": "DE",
+        "countryName": "GERMANY",
+        "isHeadquarter": False,
+        "swiftCode": "SWIFTCODEEE",
+    }
+
+    client.post("/v1/swift-codes", json=request1)
+    response = client.post("/v1/swift-codes", json=request2)
+    assert (
+        response.status_code == status.HTTP_409_CONFLICT
+    ), "Request should end with conflig (409)"
+
+    response = client.get("/v1/swift-codes/country/DE")
+    assert (
+        response.status_code == status.HTTP_404_NOT_FOUND
+    ), "Country of the bank which was not created should not exist"
+
+
 def test_delete_bank_correct_data(
     session: Session, client: TestClient, banks_data, countries_data_after_excel
 ):
@@ -562,3 +646,37 @@ def test_delete_bank_not_found(
     send_request_with_incorrect_code(
         code_type="SWIFT", request_path="/v1/swift-codes/", client_request=client.delete
     )
+
+
+def test_read_related_banks_sorted(
+    session: Session, client: TestClient, banks_data, countries_data_after_excel
+):
+    """Tests if branches and banks of countries are returned in the correct order.
+
+    Branches are sorted by SWIFT code. Banks of countries are sorted
+    with headquarters first, then branches, each sorted by SWIFT code.
+
+    Parameters
+    ----------
+    session : sqlmodel.Session
+        SQLModel Session used to interact with in-memory database.
+    fastapi.TestClient
+        Test client used with in-memory database.
+    banks_data : list[dict]
+        List of dicts used for creating table models of banks (not sorted).
+    countries_data_after_excel : list[dict]
+        List of dicts used for creating table models of countries.
+    """
+    insert_exemplary_data_into_db(session, banks_data, countries_data_after_excel)
+
+    branches = client.get("/v1/swift-codes/A1234567XXX").json()["branches"]
+    swift_codes = [bank["swiftCode"] for bank in branches]
+    assert swift_codes == sorted(swift_codes), "Branches should be sorted"
+
+    for country in countries_data_after_excel:
+        banks = client.get(f"/v1/swift-codes/country/{country['iso2']}").json()
+        order = [(not b["isHeadquarter"], b["swiftCode"]) for b in banks["swiftCodes"]]
+        assert order == sorted(order), "Headquarters should come first, then branches"
+        assert any(is_branch for is_branch, _ in order) and not all(
+            is_branch for is_branch, _ in order
+        ), "Country should have both headquarters and branches"
@@ -2,48 +2,133 @@
 
 from io import BytesIO
 
-import pandas as pd
+from src.data_processing import (
+    banks_data_from_rows,
+    extract_all_data,
+    extract_banks_data,
+    extract_countries_data,
+    read_excel_data,
+)
 
-from src.data_processing import extract_banks_data, extract_countries_data
 
-
-def test_extract_banks_data(mock_df, banks_data_after_excel):
+def test_extract_banks_data(mock_excel_bytes, banks_data_after_excel):
     """Tests extracting banks data.
 
     Parameters
     ----------
-    mock_df : pandas.DataFrame
-        The data used in mock Excel file.
+    mock_excel_bytes : bytes
+        Content of the mock Excel file.
     banks_data_after_excel : list[dict]
         List of dicts representing expected results.
     """
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        mock_df.to_excel(writer, sheet_name="Sheet1", index=False)
+    output = BytesIO(mock_excel_bytes)
 
     xslx_data = extract_banks_data(output)
 
     assert xslx_data == banks_data_after_excel, "Extracted banks' data is incorrect"
 
 
-def test_extract_countries_data(mock_df, countries_data_after_excel):
+def test_extract_countries_data(mock_excel_bytes, countries_data_after_excel):
     """Tests extracting countries data.
 
     Parameters
     ----------
-    mock_df : pandas.DataFrame
-        The data used in mock Excel file.
+    mock_excel_bytes : bytes
+        Content of the mock Excel file.
     countries_data_after_excel : list[dict]
         List of dicts representing expected results.
     """
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        mock_df.to_excel(writer, sheet_name="Sheet1", index=False)
+    output = BytesIO(mock_excel_bytes)
 
     xslx_data = extract_countries_data(output)
 
     assert (
         xslx_data == countries_data_after_excel
     ), "Extracted countries' data is incorrect"
+
+
+def test_extract_all_data(
+    mock_excel_bytes, banks_data_after_excel, countries_data_after_excel
+):
+    """Tests extracting banks and countries data in a single pass.
+
+    Parameters
+    ----------
+    mock_excel_bytes : bytes
+        Content of the mock Excel file.
+    banks_data_after_excel : list[dict]
+        List of dicts representing expected banks results.
+    countries_data_after_excel : list[dict]
+        List of dicts representing expected countries results.
+    """
+    output = BytesIO(mock_excel_bytes)
+
+    banks_data, countries_data = extract_all_data(output)
+
+    assert banks_data == banks_data_after_excel, "Extracted banks' data is incorrect"
+    assert (
+        countries_data == countries_data_after_excel
+    ), "Extracted countries' data is incorrect"
+
+
+def test_extract_all_data_incorrect_path(tmp_path):
+    """Tests if no data is extracted when the Excel file does not exist.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by pytest.
+    """
+    banks_data, countries_data = extract_all_data(str(tmp_path / "missing.xlsx"))
+
+    assert banks_data == [], "No banks' data should be extracted"
+    assert countries_data == [], "No countries' data should be extracted"
+
+
+def test_banks_data_from_rows_incorrect_swift_codes():
+    """Tests if banks with incorrect SWIFT codes are skipped during extraction."""
+    rows = [
+        {
+            "country_iso2": "PL",
+            "swift_code": swift_code,
+            "name": "Alior Bank",
+            "address": "Alior Bank Address",
+        }
+        for swift_code in [
+            "A1234567XXX",  # correct
+            "a1234567XXX",  # lowercase
+            "A1234567XX",  # too short
+            "A1234567XXXX",  # too long
+            "A1234567X#X",  # special character
+            "12345678901",  # no letters (rejected by the API)
+        ]
+    ]
+
+    banks_data = banks_data_from_rows(rows)
+
+    assert [bank["swift_code"] for bank in banks_data] == [
+        "A1234567XXX"
+    ], "Only banks with correct SWIFT codes should be extracted"
+
+
+def test_read_excel_data(tmp_path, mock_df, mock_excel_bytes):
+    """Tests if the Excel file is read in the same way from a path and from a file.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by pytest.
+    mock_df : pandas.DataFrame
+        The data used in mock Excel file.
+    mock_excel_bytes : bytes
+        Content of the mock Excel file.
+    """
+    file_path = tmp_path / "swift_codes.xlsx"
+    file_path.write_bytes(mock_excel_bytes)
+
+    rows = read_excel_data(str(file_path))
+
+    assert len(rows) == len(mock_df), "All rows should be read"
+    assert rows == read_excel_data(
+        BytesIO(mock_excel_bytes)
+    ), "Data read from the path and from the file should be the same"
@@ -0,0 +1,27 @@
+"""This module includes unit tests for functions from src/database.py"""
+
+import sqlite3
+
+from src.database import SQLITE_PRAGMAS, set_sqlite_pragmas
+
+
+def test_set_sqlite_pragmas(tmp_path):
+    """Tests if PRAGMAs are set on a new connection.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by pytest.
+    """
+    connection = sqlite3.connect(tmp_path / "database.db")
+
+    set_sqlite_pragmas(connection, None)
+
+    assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert (
+        connection.execute("PRAGMA cache_size").fetchone()[0]
+        == SQLITE_PRAGMAS["cache_size"]
+    )
+    connection.close()
@@ -1,7 +1,5 @@
 """This module includes unit tests for functions from src/models.py"""
 
-from sqlmodel import select
-
 from src.models import Bank, Country
 from .utils import (
     insert_exemplary_data_into_db,
@@ -26,22 +24,38 @@ def test_relationship_branches_headquarter(session, banks_data):
     session.add(default_country)
     session.commit()
 
-    for bank_data in banks_data:
-        headquarter = session.exec(
-            select(Bank).where(Bank.swift_code == bank_data["headquarter"])
-        ).first()
-
-        bank = Bank(
+    def create_bank(bank_data: dict, headquarter_id: int | None = None):
+        return Bank(
             swift_code=bank_data["swift_code"],
             name=bank_data["name"],
             address=bank_data["address"],
             is_headquarter=bank_data["is_headquarter"],
             country_id=default_country.id,
-            headquarter_id=headquarter.id if headquarter is not None else None,
+            headquarter_id=headquarter_id,
         )
 
-        session.add(bank)
-        session.commit()
+    # headquarters are flushed first, so that branches can refer to their ids
+    headquarters = {
+        bank_data["swift_code"]: create_bank(bank_data)
+        for bank_data in banks_data
+        if bank_data["is_headquarter"]
+    }
+    session.add_all(headquarters.values())
+    session.flush()
+
+    session.add_all(
+        create_bank(
+            bank_data,
+            headquarter_id=(
+                headquarters[bank_data["headquarter"]].id
+                if bank_data["headquarter"] in headquarters
+                else None
+            ),
+        )
+        for bank_data in banks_data
+        if not bank_data["is_headquarter"]
+    )
+    session.commit()
 
     query_created_relationship_branches_headquarter(session)
 
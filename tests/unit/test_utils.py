@@ -6,9 +6,11 @@ from fastapi import HTTPException
 from sqlmodel import Session, select
 
 from src.utils import (
+    ResponseCache,
     check_if_proper_headquarter_or_branch,
     create_banks,
     create_countries,
+    get_valid_swift_code,
 )
 from src.models import Bank, Country
 
@@ -102,3 +104,36 @@ def test_check_if_proper_headquarter_or_branch():
             check_if_proper_headquarter_or_branch(
                 pair["swift_code"], pair["is_headquarter"]
             )
+
+
+def test_get_valid_swift_code():
+    """Tests if SWIFT codes accepted by the regex match the ones accepted by the checks."""
+
+    correct_examples = ["AAAAAAAAXXX", "A1AXXXC4123", "XXXXXXXX123"]
+    incorrect_examples = {
+        "12345678901": "All characters in SWIFT code should be uppercase.",
+        "AAAAAAAAXXx": "All characters in SWIFT code should be uppercase.",
+        "AAAAAAAAXX": "SWIFT code should consist of 11 characters.",
+        "AAAAAAAAXX#": "All characters in SWIFT code should be alphanumeric.",
+    }
+
+    for swift_code in correct_examples:
+        assert get_valid_swift_code(swift_code) == swift_code
+
+    for swift_code, detail in incorrect_examples.items():
+        with pytest.raises(HTTPException, match=detail):
+            get_valid_swift_code(swift_code)
+
+
+def test_response_cache_set_after_clear():
+    """Tests if a response read before the cache was cleared is not stored after it."""
+    cache = ResponseCache()
+    key = ("bank", "A1234567XXX")
+
+    version = cache.version  # read before querying the database
+    cache.clear()  # e.g., the bank was deleted in the meantime
+    cache.set(key, b"stale", version)
+    assert cache.get(key) is None, "Response read before clear should not be cached"
+
+    cache.set(key, b"fresh", cache.version)
+    assert cache.get(key) == b"fresh", "Response read after clear should be cached"
@@ -2,6 +2,7 @@
 
 from typing import Callable, Literal
 
+from sqlalchemy import insert
 from sqlmodel import select
 from starlette.responses import Response
 
@@ -18,28 +19,11 @@ def check_if_expected_banks_in_list(request_banks: list[dict], expected_banks: d
     expected_banks : dict[str, dict[str, str | bool]]
         Dict showing expected values of expected banks
     """
-    for _, expected_bank in expected_banks.items():
-        banks = request_banks
+    banks = {bank["swiftCode"]: bank for bank in request_banks}
 
-        found_expected_bank = False
-
-        for bank in banks:
-            if bank["swiftCode"] == expected_bank["swiftCode"]:
-                found_expected_bank = True
-
-                keys = [
-                    "address",
-                    "bankName",
-                    "countryISO2",
-                    "isHeadquarter",
-                    "swiftCode",
-                ]
-
-                for key in keys:
-                    assert bank[key] == expected_bank[key], f"Bank {key} is different"
-                break
-
-        assert found_expected_bank, "Did not found all expected banks"
+    for swift_code, expected_bank in expected_banks.items():
+        assert swift_code in banks, "Did not found all expected banks"
+        assert banks[swift_code] == expected_bank, f"Bank {swift_code} is different"
 
 
 def check_bank_data_correctness(request_result: dict, expected_result: dict):
@@ -158,6 +142,8 @@ def get_countries(session):
 def insert_exemplary_data_into_db(session, banks_data, countries_data_after_excel):
     """Inserts exemplary data into the database.
 
+    Rows are inserted in bulk (one INSERT per table model) and committed once.
+
     Parameters
     ----------
     session : sqlmodel.Session
@@ -167,30 +153,46 @@ def insert_exemplary_data_into_db(session, banks_data, countries_data_after_exce
     countries_data_after_excel : list[dict]
         List of dicts used for creating table models of countries.
     """
-    for country_data in countries_data_after_excel:
-        country = Country(iso2=country_data["iso2"], name=country_data["name"])
-        session.add(country)
-        session.commit()
-
-    for bank_data in banks_data:
-        country = session.exec(
-            select(Country).where(Country.iso2 == bank_data["country_iso2"])
-        ).first()
-        headquarter = session.exec(
-            select(Bank).where(Bank.swift_code == bank_data["headquarter"])
-        ).first()
-
-        bank = Bank(
-            swift_code=bank_data["swift_code"],
-            name=bank_data["name"],
-            address=bank_data["address"],
-            is_headquarter=bank_data["is_headquarter"],
-            country_id=country.id if country is not None else None,
-            headquarter_id=headquarter.id if headquarter is not None else None,
-        )
+    country_ids = dict(
+        session.exec(
+            insert(Country).returning(Country.iso2, Country.id),
+            params=[
+                {"iso2": country_data["iso2"], "name": country_data["name"]}
+                for country_data in countries_data_after_excel
+            ],
+        ).all()
+    )
 
-        session.add(bank)
-        session.commit()
+    def to_mapping(bank_data: dict, headquarter_ids: dict[str, int]):
+        return {
+            "swift_code": bank_data["swift_code"],
+            "name": bank_data["name"],
+            "address": bank_data["address"],
+            "is_headquarter": bank_data["is_headquarter"],
+            "country_id": country_ids.get(bank_data["country_iso2"]),
+            "headquarter_id": headquarter_ids.get(bank_data["headquarter"]),
+        }
+
+    # headquarters are inserted first, so that branches can refer to them
+    headquarter_ids = dict(
+        session.exec(
+            insert(Bank).returning(Bank.swift_code, Bank.id),
+            params=[
+                to_mapping(bank_data, {})
+                for bank_data in banks_data
+                if bank_data["is_headquarter"]
+            ],
+        ).all()
+    )
+    session.exec(
+        insert(Bank),
+        params=[
+            to_mapping(bank_data, headquarter_ids)
+            for bank_data in banks_data
+            if not bank_data["is_headquarter"]
+        ],
+    )
+    session.commit()
 
 
 def diff_between_codes(code_type: Literal["SWIFT", "ISO2"]):